@@ -5,6 +5,7 @@ Having settings in one place makes it easy to modify the application's behavior.
 """
 
 import os  # For file path operations
+import shutil  # For locating executables on the system PATH
 
 class Config:
     """
@@ -40,10 +41,32 @@ class Config:
     # ===== OCR SETTINGS =====
     # Tesseract OCR configuration options
     # These settings optimize OCR for medical text recognition
-    TESSERACT_CONFIG = '--oem 3 --psm 6'  
+    TESSERACT_CONFIG = '--oem 3 --psm 6'
     # oem 3: Use both legacy and LSTM OCR engine modes
     # psm 6: Assume a single uniform block of text
+
+    # How many OpenMP threads Tesseract may use internally (exported as
+    # OMP_THREAD_LIMIT by setup_tesseract). Defaults to 1: Tesseract's
+    # own OpenMP parallelism has heavy coordination overhead and is
+    # often slower than single-threaded, and pinning it to 1 lets
+    # batch_ocr scale across images with a process pool instead. Raise
+    # it only for huge single images on an otherwise idle machine.
+    TESSERACT_THREADS = 1
     
+    # ===== FRAME QUALITY GATE =====
+    # Captures scoring below these thresholds are rejected before OCR
+    # runs - Tesseract is the expensive step, and clearly blurry or
+    # badly lit frames only waste it. The bands match the ones the
+    # 'p' quality preview reports.
+    MIN_SHARPNESS = 50       # Laplacian variance below this = too blurry
+    MIN_BRIGHTNESS = 80      # Mean gray level below this = too dark
+    MAX_BRIGHTNESS = 180     # Mean gray level above this = too bright
+
+    # Stop trying further OCR configurations once one scores at least
+    # this confidence - each extra configuration costs two full
+    # Tesseract runs, and a read this good is never beaten in practice
+    OCR_EARLY_EXIT_CONFIDENCE = 85
+
     # ===== TEXT PROCESSING SETTINGS =====
     # Minimum text length to consider valid (helps filter out noise)
     MIN_TEXT_LENGTH = 3
@@ -80,6 +103,50 @@ class Config:
         'RESET': '\033[0m'      # Reset to default color
     }
     
+    @classmethod
+    def get_tesseract_path(cls):
+        """
+        Resolve the Tesseract executable path, checking the filesystem
+        only on the first call. The winner is memoized as a class
+        attribute so later calls are a simple attribute lookup instead
+        of repeating several os.path checks.
+
+        Resolution order:
+            1. The TESSERACT_CMD environment variable (explicit override
+               for relocated or custom installs)
+            2. shutil.which("tesseract") - a single PATH scan that
+               covers Linux/macOS and any install added to PATH
+            3. The known Windows install locations that exist on disk
+
+        Returns:
+            str or None: Path to the Tesseract executable (or the bare
+                "tesseract" command if it is on the system PATH), or
+                None if no working installation was found.
+        """
+        resolved = cls.__dict__.get("_resolved_tesseract")
+        if resolved is not None:
+            return resolved
+
+        # Explicit user override wins outright
+        env_cmd = os.environ.get("TESSERACT_CMD")
+        if env_cmd:
+            cls._resolved_tesseract = env_cmd
+            return cls._resolved_tesseract
+
+        # One PATH lookup replaces probing each hard-coded location
+        if shutil.which("tesseract"):
+            cls._resolved_tesseract = "tesseract"
+            return cls._resolved_tesseract
+
+        # TESSERACT_PATHS_RESOLVED was filtered at import time, so only
+        # candidates that actually existed need to be considered here
+        for path in cls.TESSERACT_PATHS_RESOLVED:
+            if path != "tesseract":
+                cls._resolved_tesseract = path
+                return cls._resolved_tesseract
+
+        return None
+
     @classmethod
     def get_temp_dir(cls):
         """
@@ -91,7 +158,11 @@ class Config:
             str: Path to the temporary directory
         """
         temp_dir = os.path.dirname(cls.TEMP_IMAGE_PATH)
-        os.makedirs(temp_dir, exist_ok=True)
+        # Only touch the filesystem the first time; afterwards this is
+        # just an attribute check
+        if not cls.__dict__.get("_temp_dir_ensured"):
+            os.makedirs(temp_dir, exist_ok=True)
+            cls._temp_dir_ensured = True
         return temp_dir
     
     @classmethod
@@ -110,13 +181,25 @@ class Config:
         Print current configuration settings.
         Useful for troubleshooting and setup verification.
         """
-        print(f"\n📋 {cls.APP_NAME} v{cls.APP_VERSION} Configuration:")
-        print("-" * 40)
-        print(f"Temp Image Path: {cls.TEMP_IMAGE_PATH}")
-        print(f"Camera Resolution: {cls.CAMERA_WIDTH}x{cls.CAMERA_HEIGHT}")
-        print(f"Debug Mode: {cls.DEBUG_MODE}")
-        print(f"Min Text Length: {cls.MIN_TEXT_LENGTH}")
-        print("-" * 40)
+        # One formatted block and one print call, instead of seven
+        # separate stdout writes/flushes
+        separator = "-" * 40
+        print(f"\n📋 {cls.APP_NAME} v{cls.APP_VERSION} Configuration:\n"
+              f"{separator}\n"
+              f"Temp Image Path: {cls.TEMP_IMAGE_PATH}\n"
+              f"Camera Resolution: {cls.CAMERA_WIDTH}x{cls.CAMERA_HEIGHT}\n"
+              f"Debug Mode: {cls.DEBUG_MODE}\n"
+              f"Min Text Length: {cls.MIN_TEXT_LENGTH}\n"
+              f"{separator}")
+
+# Expand environment variables (like %USERNAME%) in the Tesseract
+# candidates once at import time, and drop entries that don't exist on
+# this machine. Doing this at class-definition time means the lookups in
+# get_tesseract_path never re-expand or re-stat dead candidates.
+Config.TESSERACT_PATHS_RESOLVED = tuple(
+    path for path in (os.path.expandvars(p) for p in Config.TESSERACT_PATHS)
+    if path == "tesseract" or os.path.isfile(path)
+)
 
 # Example of how to use this configuration file:
 # 
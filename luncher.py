@@ -4,23 +4,31 @@ This script allows users to choose between GUI and console modes.
 """
 
 import sys
-import argparse
 
 def main():
     """Main launcher function."""
-    parser = argparse.ArgumentParser(description='Doctors Note Upscaler Launcher')
-    parser.add_argument('--mode', choices=['gui', 'console'], default='gui',
-                       help='Run mode: gui (default) or console')
-    parser.add_argument('--console', action='store_true',
-                       help='Run in console mode (shortcut for --mode=console)')
-    
-    args = parser.parse_args()
-    
-    # Determine run mode
-    if args.console:
-        run_mode = 'console'
+    if len(sys.argv) == 1:
+        # Fast path: a plain launch means GUI mode, so skip building an
+        # argument parser that has nothing to parse
+        run_mode = 'gui'
     else:
-        run_mode = args.mode
+        # argparse (and the mode modules below) are imported lazily so
+        # the launcher itself stays cheap to load
+        import argparse
+
+        parser = argparse.ArgumentParser(description='Doctors Note Upscaler Launcher')
+        parser.add_argument('--mode', choices=['gui', 'console'], default='gui',
+                           help='Run mode: gui (default) or console')
+        parser.add_argument('--console', action='store_true',
+                           help='Run in console mode (shortcut for --mode=console)')
+
+        args = parser.parse_args()
+
+        # Determine run mode
+        if args.console:
+            run_mode = 'console'
+        else:
+            run_mode = args.mode
     
     print(f"🏥 Starting Doctors Note Upscaler in {run_mode} mode...")
     